@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Platform Launch Analyzer - Renderer Benchmarks
+Measures portfolio rendering throughput and peak memory for each output format
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Dict, Iterator
+
+from platform_assessment import PlatformAssessment
+from report_renderers import RENDERERS, get_renderer, write_portfolio
+
+
+ANSWER_CHOICES = {
+    'sides_defined': ['yes', 'no'],
+    'value_unit_clear': ['yes', 'no'],
+    'interaction_designed': ['yes', 'no'],
+    'governance_defined': ['yes', 'no'],
+    'control_mechanism': ['yes', 'no'],
+    'same_side_strength': ['strong', 'moderate', 'weak', 'none'],
+    'cross_side_strength': ['strong', 'moderate', 'weak', 'none'],
+    'standalone_value': ['yes', 'no'],
+    'marquee_users': ['yes', 'no'],
+    'subsidy_strategy': ['strategic', 'minimal', 'none'],
+    'chicken_egg_solution': ['yes', 'no'],
+    'single_side_start': ['yes', 'no'],
+    'multi_homing_costs': ['high', 'moderate', 'low'],
+    'differentiation': ['yes', 'no'],
+    'switching_costs': ['high', 'moderate', 'low'],
+    'reduces_search_costs': ['yes', 'no'],
+    'reduces_transaction_costs': ['yes', 'no'],
+    'trust_mechanisms': ['yes', 'no'],
+    'revenue_model_clear': ['yes', 'no'],
+    'pricing_side_identified': ['yes', 'no'],
+    'pricing_structure': ['rake', 'subscription', 'freemium', 'ads', 'undefined'],
+    'pricing_sustainable': ['yes', 'no'],
+}
+
+
+class CountingSink:
+    """Write-only stream that discards output and counts characters"""
+
+    def __init__(self):
+        self.chars = 0
+
+    def write(self, text: str) -> int:
+        self.chars += len(text)
+        return len(text)
+
+
+def synthetic_reports(count: int, seed: int, pool_size: int = 256) -> Iterator[Dict]:
+    """Yield evaluated assessments, cycling a fixed pool so only rendering is timed"""
+    rng = random.Random(seed)
+    pool = []
+    for i in range(pool_size):
+        answers = {key: rng.choice(choices) for key, choices in ANSWER_CHOICES.items()}
+        answers['platform_name'] = f"Synthetic Platform {i}"
+        pool.append(PlatformAssessment().evaluate(answers))
+    for i in range(count):
+        yield pool[i % pool_size]
+
+
+def benchmark(output_format: str, count: int, seed: int, track_memory: bool) -> Dict:
+    """Render a portfolio of count assessments and return timing figures"""
+    sink = CountingSink()
+    reports = synthetic_reports(count, seed)
+    if track_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    write_portfolio(reports, get_renderer(output_format), sink)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if track_memory:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return {
+        'format': output_format,
+        'seconds': elapsed,
+        'per_second': count / elapsed,
+        'mb_per_second': sink.chars / elapsed / 1e6,
+        'output_mb': sink.chars / 1e6,
+        'peak_kb': peak / 1024 if peak is not None else None
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark report renderers')
+    parser.add_argument('--count', '-n', type=int, default=100000,
+                       help='Assessments per portfolio')
+    parser.add_argument('--format', '-f', choices=sorted(RENDERERS), action='append',
+                       help='Format to benchmark (repeatable, default: all)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed for synthetic answers')
+    parser.add_argument('--memory', action='store_true',
+                       help='Track peak memory with tracemalloc (slows rendering)')
+
+    args = parser.parse_args()
+
+    print(f"Rendering {args.count} assessments per format")
+    print(f"{'FORMAT':<10}{'SECONDS':>10}{'REPORTS/S':>12}{'MB/S':>8}{'OUTPUT MB':>11}{'PEAK KB':>10}")
+    print("-" * 61)
+    for output_format in args.format or sorted(RENDERERS):
+        result = benchmark(output_format, args.count, args.seed, args.memory)
+        peak = f"{result['peak_kb']:.0f}" if result['peak_kb'] is not None else '-'
+        print(f"{result['format']:<10}{result['seconds']:>10.2f}{result['per_second']:>12.0f}"
+              f"{result['mb_per_second']:>8.1f}{result['output_mb']:>11.1f}{peak:>10}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,501 @@
+#!/usr/bin/env python3
+"""
+Platform Launch Analyzer - Rubric Calibration
+Fits answer weights and viability bands to labeled assessment outcomes
+"""
+
+import csv
+import json
+import argparse
+import itertools
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from platform_assessment import DEFAULT_RUBRIC
+
+
+# Viability bands from worst to best; outcome labels map onto these in order
+BANDS = ['WEAK', 'QUESTIONABLE', 'MODERATE', 'STRONG']
+
+# One feature per scored answer, in rubric order. Answers are stored as a
+# per-question code: 0 for anything unscored, 1.. for each rubric option.
+QUESTIONS = list(DEFAULT_RUBRIC['weights'])
+FEATURES = [(q, option) for q in QUESTIONS for option in DEFAULT_RUBRIC['weights'][q]]
+FEATURE_QUESTION = [QUESTIONS.index(q) for q, _ in FEATURES]
+FEATURE_CODE = [list(DEFAULT_RUBRIC['weights'][q]).index(option) + 1 for q, option in FEATURES]
+
+# The engine lower-cases yes/no answers but compares the others verbatim
+YES_NO_QUESTIONS = {q for q in QUESTIONS if set(DEFAULT_RUBRIC['weights'][q]) == {'yes'}}
+
+CHUNK_ROWS = 1 << 16
+CSV_CHUNK_ROWS = 1 << 15
+
+
+def load_history(path: str, label_field: str, levels: List[str]) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Load labeled assessments into uint8 answer codes and outcome indices.
+
+    Files ending in .csv are parsed in bulk with NumPy (one column per
+    question plus the label column); anything else is read as NDJSON.
+    """
+    if path.lower().endswith('.csv'):
+        return _load_csv(path, label_field, levels)
+    return _load_ndjson(path, label_field, levels)
+
+
+def _load_ndjson(path: str, label_field: str, levels: List[str]) -> Tuple['np.ndarray', 'np.ndarray']:
+    level_index = {level.lower(): i for i, level in enumerate(levels)}
+    lookups = []
+    for q in QUESTIONS:
+        options = {option: code for code, option in enumerate(DEFAULT_RUBRIC['weights'][q], 1)}
+        lookups.append((q, options.get, q in YES_NO_QUESTIONS))
+
+    codes = bytearray()
+    labels = bytearray()
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                row = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({e})") from None
+            if not isinstance(row, dict):
+                raise ValueError(f"{path}:{line_number}: expected a JSON object of answers")
+            label = level_index.get(str(row.get(label_field, '')).lower())
+            if label is None:
+                raise ValueError(f"{path}:{line_number}: '{label_field}' must be one of {', '.join(levels)}")
+            labels.append(label)
+            for q, lookup, lower in lookups:
+                value = row.get(q, '')
+                if lower and isinstance(value, str):
+                    value = value.lower()
+                codes.append(lookup(value, 0) if isinstance(value, str) else 0)
+
+    answer_codes = np.frombuffer(bytes(codes), dtype=np.uint8).reshape(len(labels), len(QUESTIONS))
+    return answer_codes, np.frombuffer(bytes(labels), dtype=np.uint8).astype(np.intp)
+
+
+def _load_csv(path: str, label_field: str, levels: List[str]) -> Tuple['np.ndarray', 'np.ndarray']:
+    level_values = [level.lower() for level in levels]
+    width = max(len(option) for option in level_values + [o for q in QUESTIONS for o in DEFAULT_RUBRIC['weights'][q]]) + 1
+    code_blocks = []
+    label_blocks = []
+    # utf-8-sig drops a byte order mark that would otherwise hide the first column name
+    with open(path, 'r', encoding='utf-8-sig', newline='') as f:
+        header = [name.strip() for name in next(csv.reader([f.readline()]), [])]
+        if label_field not in header:
+            raise ValueError(f"{path}: no '{label_field}' column in the header")
+        missing = [q for q in QUESTIONS if q not in header]
+        if missing:
+            raise ValueError(f"{path}: no column in the header for {', '.join(missing)}")
+        label_column = header.index(label_field)
+        columns = [(qi, header.index(q), q in YES_NO_QUESTIONS,
+                    list(DEFAULT_RUBRIC['weights'][q]))
+                   for qi, q in enumerate(QUESTIONS)]
+        first_line = 2
+        while True:
+            lines = list(itertools.islice(f, CSV_CHUNK_ROWS))
+            if not lines:
+                break
+            try:
+                # Longer values are truncated, but can then never equal an option or label
+                table = np.loadtxt(lines, delimiter=',', dtype=f'U{width}', quotechar='"',
+                                   comments=None, ndmin=2)
+            except ValueError as e:
+                raise ValueError(f"{path}: rows from line {first_line}: {e}") from None
+
+            labels = _match_codes(table[:, label_column], level_values, lower=True)
+            if not labels.all():
+                line_number = first_line + int(np.flatnonzero(labels == 0)[0])
+                raise ValueError(f"{path}:{line_number}: '{label_field}' must be one of {', '.join(levels)}")
+            label_blocks.append(labels - 1)
+
+            block = np.zeros((len(table), len(QUESTIONS)), dtype=np.uint8)
+            for qi, column, lower, options in columns:
+                block[:, qi] = _match_codes(table[:, column], options, lower)
+            code_blocks.append(block)
+            first_line += len(lines)
+
+    if not code_blocks:
+        return np.zeros((0, len(QUESTIONS)), dtype=np.uint8), np.zeros(0, dtype=np.intp)
+    return np.concatenate(code_blocks), np.concatenate(label_blocks).astype(np.intp)
+
+
+def _match_codes(values: 'np.ndarray', options: List[str], lower: bool) -> 'np.ndarray':
+    """1-based index of each value in options, 0 where none matches"""
+    codes = np.zeros(len(values), dtype=np.uint8)
+    for code, option in enumerate(options, 1):
+        codes[values == option] = code
+    if lower:
+        # Lower-casing is slow, so only do it for values that are not already
+        # an option or the canonical "no"
+        rest = np.flatnonzero((codes == 0) & (values != 'no'))
+        if len(rest):
+            lowered = np.char.lower(values[rest])
+            for code, option in enumerate(options, 1):
+                codes[rest[lowered == option]] = code
+    return codes
+
+
+class AnswerMatrix:
+    """One-hot answer features, expanded chunk by chunk from uint8 answer codes.
+
+    rows selects a subset of the history (such as a training fold) and
+    columns a subset of FEATURES, without copying the codes.
+    """
+
+    def __init__(self, codes: 'np.ndarray', rows: 'np.ndarray' = None, columns: 'np.ndarray' = None):
+        self.codes = codes
+        self.rows = rows
+        self.columns = np.ones(len(FEATURES), dtype=bool) if columns is None else columns
+        self._question = np.array(FEATURE_QUESTION)[self.columns]
+        self._code = np.array(FEATURE_CODE, dtype=np.uint8)[self.columns]
+        self.shape = (len(codes) if rows is None else len(rows), int(self.columns.sum()))
+
+    def with_columns(self, columns: 'np.ndarray') -> 'AnswerMatrix':
+        return AnswerMatrix(self.codes, self.rows, columns)
+
+    def chunks(self):
+        """Yield (start, stop, dense float64 block) over the selected rows"""
+        n = self.shape[0]
+        for start in range(0, n, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, n)
+            block = self.codes[start:stop] if self.rows is None else self.codes[self.rows[start:stop]]
+            yield start, stop, (block[:, self._question] == self._code).astype(float)
+
+    def dot(self, w: 'np.ndarray') -> 'np.ndarray':
+        """X @ w"""
+        out = np.empty(self.shape[0])
+        for start, stop, block in self.chunks():
+            out[start:stop] = block @ w
+        return out
+
+    def tdot(self, v: 'np.ndarray') -> 'np.ndarray':
+        """X.T @ v"""
+        out = np.zeros(self.shape[1])
+        for start, stop, block in self.chunks():
+            out += block.T @ v[start:stop]
+        return out
+
+    def products(self, M: 'np.ndarray', d: 'np.ndarray') -> Tuple['np.ndarray', 'np.ndarray']:
+        """X.T @ M and X.T @ diag(d) @ X in a single pass"""
+        XtM = np.zeros((self.shape[1], M.shape[1]))
+        gram = np.zeros((self.shape[1], self.shape[1]))
+        for start, stop, block in self.chunks():
+            XtM += block.T @ M[start:stop]
+            gram += block.T @ (block * d[start:stop, None])
+        return XtM, gram
+
+
+def _sigmoid(x: 'np.ndarray') -> 'np.ndarray':
+    with np.errstate(over='ignore'):
+        return 1.0 / (1.0 + np.exp(-x))
+
+
+def _cumulative(X: AnswerMatrix, y: 'np.ndarray', w: 'np.ndarray', theta: 'np.ndarray'):
+    """Cumulative probabilities at each row's upper and lower cut, and the row likelihood"""
+    eta = X.dot(w)
+    cuts = np.concatenate(([-np.inf], theta, [np.inf]))
+    Fa = _sigmoid(cuts[y + 1] - eta)
+    Fb = _sigmoid(cuts[y] - eta)
+    return Fa, Fb, np.maximum(Fa - Fb, 1e-300)
+
+
+def _ordinal_terms(X: AnswerMatrix, y: 'np.ndarray', w: 'np.ndarray', theta: 'np.ndarray'):
+    """Per-row likelihood and its derivatives for the cumulative logit model"""
+    Fa, Fb, p = _cumulative(X, y, w, theta)
+    fa = Fa * (1 - Fa)
+    fb = Fb * (1 - Fb)
+    la = fa / p
+    lb = -fb / p
+    laa = fa * (1 - 2 * Fa) / p - la * la
+    lbb = -fb * (1 - 2 * Fb) / p - lb * lb
+    lab = -la * lb
+    return p, la, lb, laa, lbb, lab
+
+
+def ordinal_derivatives(X: AnswerMatrix, y: 'np.ndarray', n_levels: int, w: 'np.ndarray',
+                        theta: 'np.ndarray', ridge: float = 1.0) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Gradient and Hessian of the penalized log-likelihood in (w, theta)"""
+    n, n_features = X.shape
+    K = n_levels - 1
+    p, la, lb, laa, lbb, lab = _ordinal_terms(X, y, w, theta)
+    upper_rows = np.flatnonzero(y < K)
+    lower_rows = np.flatnonzero(y > 0)
+
+    # Column 0 feeds the gradient, the rest the weight/threshold Hessian block
+    cross = np.zeros((n, K + 1))
+    cross[:, 0] = -(la + lb)
+    cross[upper_rows, y[upper_rows] + 1] = -(laa + lab)[upper_rows]
+    cross[lower_rows, y[lower_rows]] += -(lab + lbb)[lower_rows]
+    products, gram = X.products(cross, laa + 2 * lab + lbb)
+
+    grad = np.empty(n_features + K)
+    grad[:n_features] = products[:, 0] - ridge * w
+    grad[n_features:] = (np.bincount(y, la, n_levels)[:-1] + np.bincount(y, lb, n_levels)[1:])
+
+    hess = np.empty((n_features + K, n_features + K))
+    hess[:n_features, :n_features] = gram - ridge * np.eye(n_features)
+    hess[:n_features, n_features:] = products[:, 1:]
+    hess[n_features:, :n_features] = products[:, 1:].T
+    theta_block = np.diag(np.bincount(y, laa, n_levels)[:-1] + np.bincount(y, lbb, n_levels)[1:])
+    off = np.bincount(y, lab, n_levels)[1:-1]
+    theta_block += np.diag(off, 1) + np.diag(off, -1)
+    hess[n_features:, n_features:] = theta_block
+    return grad, hess
+
+
+def log_likelihood(X: AnswerMatrix, y: 'np.ndarray', w: 'np.ndarray', theta: 'np.ndarray',
+                   ridge: float = 1.0) -> float:
+    """Penalized log-likelihood of the cumulative logit model"""
+    return np.log(_cumulative(X, y, w, theta)[2]).sum() - 0.5 * ridge * (w @ w)
+
+
+def fit_ordinal(X: AnswerMatrix, y: 'np.ndarray', n_levels: int, ridge: float = 1.0,
+                start: Tuple['np.ndarray', 'np.ndarray'] = None,
+                max_iter: int = 50, tol: float = 1e-8) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Fit a proportional-odds (ordinal logistic) model by Newton's method.
+
+    P(outcome <= k) = sigmoid(theta[k] - X @ w). Returns (w, theta); start
+    optionally warm-starts from an earlier (w, theta).
+    """
+    n, n_features = X.shape
+    counts = np.bincount(y, minlength=n_levels)
+    if np.any(counts == 0):
+        missing = [BANDS[k] if n_levels == len(BANDS) else str(k) for k in np.flatnonzero(counts == 0)]
+        raise ValueError(f"every outcome level needs examples; none for {', '.join(missing)}")
+    if start is None:
+        cumulative = np.cumsum(counts)[:-1] / n
+        w = np.zeros(n_features)
+        theta = np.log(cumulative / (1 - cumulative))
+    else:
+        w, theta = start
+
+    current = log_likelihood(X, y, w, theta, ridge)
+    for _ in range(max_iter):
+        grad, hess = ordinal_derivatives(X, y, n_levels, w, theta, ridge)
+        step = np.linalg.solve(-hess, grad)
+        # Half the Newton decrement estimates the remaining gain in log-likelihood
+        if grad @ step < 2 * tol * abs(current):
+            break
+
+        # Backtrack until the thresholds stay ordered and the likelihood improves
+        t = 1.0
+        for _ in range(30):
+            new_w = w + t * step[:n_features]
+            new_theta = theta + t * step[n_features:]
+            if np.all(np.diff(new_theta) > 0):
+                candidate = log_likelihood(X, y, new_w, new_theta, ridge)
+                if candidate >= current:
+                    break
+            t /= 2
+        else:
+            break
+        w, theta = new_w, new_theta
+        current = candidate
+    return w, theta
+
+
+def weight_gradient(X: AnswerMatrix, y: 'np.ndarray', w: 'np.ndarray', theta: 'np.ndarray',
+                    ridge: float = 1.0) -> 'np.ndarray':
+    """Gradient of the penalized log-likelihood with respect to w only"""
+    p, la, lb, laa, lbb, lab = _ordinal_terms(X, y, w, theta)
+    return X.tdot(-(la + lb)) - ridge * w
+
+
+def fit_nonnegative(X: AnswerMatrix, y: 'np.ndarray', n_levels: int, ridge: float = 1.0,
+                    start: Tuple['np.ndarray', 'np.ndarray'] = None,
+                    tol: float = 1e-6) -> Tuple['np.ndarray', 'np.ndarray']:
+    """Fit with every answer weight >= 0 using a Lawson-Hanson style active set.
+
+    The engine only awards points for an answer, so an answer that predicts
+    worse outcomes than leaving the question unmet is pinned at zero. Free
+    weights are refitted by Newton's method. When one turns negative, the fit
+    moves from the last feasible point toward the new one and stops where
+    the first weight reaches zero, and that weight is pinned. Once all free
+    weights are positive, the pinned weight with the largest positive
+    gradient is freed again. The loop ends when no pinned weight has a
+    positive gradient, which is the constrained optimum. A round limit
+    guards against cycling.
+    """
+    n_features = X.shape[1]
+    gradient_tol = tol * len(y)
+    active = np.ones(n_features, dtype=bool)
+    w = np.zeros(n_features) if start is None else np.maximum(start[0], 0)
+    theta = None if start is None else start[1]
+    for _ in range(3 * n_features + 3):
+        guess = None if theta is None else (w[active], theta)
+        w_active, theta = fit_ordinal(X.with_columns(active), y, n_levels, ridge, guess)
+        negative = w_active < 0
+        if negative.any():
+            previous = w[active]
+            ratios = np.full(len(previous), np.inf)
+            ratios[negative] = previous[negative] / (previous[negative] - w_active[negative])
+            alpha = ratios.min()
+            moved = previous + alpha * (w_active - previous)
+            blocked = ratios <= alpha + 1e-12
+            moved[blocked] = 0.0
+            w[active] = np.maximum(moved, 0.0)
+            active[np.flatnonzero(active)[blocked]] = False
+            continue
+
+        w = np.zeros(n_features)
+        w[active] = w_active
+        if active.all():
+            break
+        gradient = np.where(active, -np.inf, weight_gradient(X, y, w, theta, ridge))
+        best = int(np.argmax(gradient))
+        if gradient[best] <= gradient_tol:
+            break
+        active[best] = True
+    return w, theta
+
+
+def to_rubric(w: 'np.ndarray', theta: 'np.ndarray', total_points: int = 600) -> Dict:
+    """Convert fitted coefficients into integer points and percentage bands"""
+    best = {}
+    for (q, _), weight in zip(FEATURES, w):
+        best[q] = max(best.get(q, 0.0), weight)
+    raw_max = sum(best.values())
+    if raw_max <= 0:
+        raise ValueError("no answer is associated with better outcomes; cannot build a rubric")
+    scale = total_points / raw_max
+
+    weights = {q: {} for q in QUESTIONS}
+    for (q, option), weight in zip(FEATURES, w):
+        weights[q][option] = int(round(weight * scale))
+    max_total = sum(max([0, *options.values()]) for options in weights.values())
+    bands = {band: round(float(np.clip(cut * scale / max_total * 100, 0, 100)), 1)
+             for band, cut in zip(BANDS[1:], theta)}
+    return {'weights': weights, 'bands': bands}
+
+
+def predict_bands(X: AnswerMatrix, rubric: Dict) -> 'np.ndarray':
+    """Viability band index the engine would assign to each row under a rubric"""
+    points = np.array([rubric['weights'].get(q, {}).get(option, 0) for q, option in FEATURES], dtype=float)
+    max_total = sum(max([0, *rubric['weights'].get(q, {}).values()]) for q in QUESTIONS)
+    percentage = X.dot(points) / max_total * 100
+    cuts = np.array([rubric['bands'][band] for band in BANDS[1:]])
+    return np.searchsorted(cuts, percentage, side='right')
+
+
+def score_predictions(predicted: 'np.ndarray', y: 'np.ndarray') -> Dict:
+    """Accuracy metrics for predicted band indices against outcomes"""
+    error = np.abs(predicted - y)
+    return {
+        'accuracy': round(float(np.mean(error == 0)), 4),
+        'within_one': round(float(np.mean(error <= 1)), 4),
+        'mean_abs_error': round(float(np.mean(error)), 4)
+    }
+
+
+def cross_validate(codes: 'np.ndarray', y: 'np.ndarray', folds: int, ridge: float,
+                   seed: int, start: Tuple['np.ndarray', 'np.ndarray'] = None) -> Dict:
+    """Out-of-fold accuracy of calibrated rubrics next to the hard-coded one"""
+    order = np.random.default_rng(seed).permutation(len(y))
+    calibrated = np.empty(len(y), dtype=np.intp)
+    for test in np.array_split(order, folds):
+        test = np.sort(test)
+        train = np.ones(len(y), dtype=bool)
+        train[test] = False
+        train = np.flatnonzero(train)
+        w, theta = fit_nonnegative(AnswerMatrix(codes, train), y[train], len(BANDS), ridge, start)
+        calibrated[test] = predict_bands(AnswerMatrix(codes, test), to_rubric(w, theta))
+    return {
+        'folds': folds,
+        'hard_coded': score_predictions(predict_bands(AnswerMatrix(codes), DEFAULT_RUBRIC), y),
+        'calibrated': score_predictions(calibrated, y)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Calibrate assessment weights from labeled outcomes')
+    parser.add_argument('--history', required=True,
+                       help='Past answers with an outcome label: NDJSON, or CSV (.csv) with one column per question')
+    parser.add_argument('--output', '-o', default='rubric.json', help='Rubric file to write')
+    parser.add_argument('--label-field', default='outcome', help='Field holding the outcome label')
+    parser.add_argument('--levels', default='weak,questionable,moderate,strong',
+                       help='Comma-separated outcome labels from worst to best (one per viability band)')
+    parser.add_argument('--folds', type=int, default=5, help='Cross-validation folds')
+    parser.add_argument('--ridge', type=float, default=1.0, help='L2 penalty on answer weights')
+    parser.add_argument('--seed', type=int, default=0, help='Random seed for fold assignment')
+
+    args = parser.parse_args()
+
+    if np is None:
+        print("Error: calibration requires NumPy (pip install numpy)")
+        sys.exit(1)
+    levels = [level.strip() for level in args.levels.split(',')]
+    if len(levels) != len(BANDS):
+        print(f"Error: --levels needs {len(BANDS)} labels, one per viability band")
+        sys.exit(1)
+    if args.folds < 2:
+        print("Error: --folds must be at least 2")
+        sys.exit(1)
+
+    try:
+        start = time.perf_counter()
+        codes, y = load_history(args.history, args.label_field, levels)
+        load_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        w, theta = fit_nonnegative(AnswerMatrix(codes), y, len(BANDS), args.ridge)
+        rubric = to_rubric(w, theta)
+        validation = cross_validate(codes, y, args.folds, args.ridge, args.seed, start=(w, theta))
+        fit_seconds = time.perf_counter() - start
+    except (OSError, ValueError, np.linalg.LinAlgError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    # Rows with a scored answer per question; a misspelled field scores nothing
+    coverage = np.count_nonzero(codes, axis=0)
+    rubric['calibration'] = {
+        'generated': datetime.now().isoformat(),
+        'history': args.history,
+        'rows': int(len(y)),
+        'levels': dict(zip(BANDS, levels)),
+        'coverage': dict(zip(QUESTIONS, coverage.tolist())),
+        'ridge': args.ridge,
+        'cross_validation': validation
+    }
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(rubric, f, indent=2)
+
+    counts = np.bincount(y, minlength=len(BANDS))
+    print("RUBRIC CALIBRATION REPORT")
+    print("=" * 70)
+    print(f"Rows: {len(y)} (loaded in {load_seconds:.1f}s, fitted in {fit_seconds:.1f}s)")
+    print("Outcomes: " + ", ".join(f"{level} {count}" for level, count in zip(levels, counts)))
+    print()
+    print(f"{args.folds}-FOLD CROSS-VALIDATION")
+    print("-" * 70)
+    print(f"{'RUBRIC':<14}{'ACCURACY':>10}{'WITHIN ONE':>12}{'MEAN ABS ERROR':>16}")
+    for name, key in (('Hard-coded', 'hard_coded'), ('Calibrated', 'calibrated')):
+        metrics = validation[key]
+        print(f"{name:<14}{metrics['accuracy']:>10.1%}{metrics['within_one']:>12.1%}"
+              f"{metrics['mean_abs_error']:>16.3f}")
+    print()
+    print("ANSWER COVERAGE (rows with a scored answer)")
+    print("-" * 70)
+    for q, count in zip(QUESTIONS, coverage):
+        note = "  <- no scored answers; check the field name" if count == 0 else ""
+        print(f"{q:<28}{count:>10}{count / max(len(y), 1):>8.1%}{note}")
+    print()
+    print("BANDS (minimum overall %)")
+    print("-" * 70)
+    for band in BANDS[1:]:
+        print(f"{band:<14}{DEFAULT_RUBRIC['bands'][band]:>6} -> {rubric['bands'][band]}")
+    print()
+    print(f"Rubric saved to: {args.output}")
+    print(f"Use it with: python3 scripts/platform_assessment.py --rubric {args.output} ...")
+
+
+if __name__ == '__main__':
+    main()
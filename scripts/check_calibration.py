@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Platform Launch Analyzer - Calibration Checks
+Verifies the ordinal regression derivatives, weight recovery and default rubric scores
+"""
+
+import json
+import argparse
+import os
+import random
+import sys
+
+import numpy as np
+
+from calibrate_weights import (BANDS, FEATURES, QUESTIONS, AnswerMatrix, fit_nonnegative,
+                               log_likelihood, ordinal_derivatives, predict_bands, to_rubric,
+                               weight_gradient)
+from platform_assessment import DEFAULT_RUBRIC, PlatformAssessment
+
+
+EXAMPLE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'assets', 'example_airbnb.json')
+
+# Scores from the engine before weights moved into DEFAULT_RUBRIC
+BASELINE_AIRBNB = [100, 70, 90, 55, 100, 100]
+BEST_ANSWERS = {q: max(options, key=options.get) for q, options in DEFAULT_RUBRIC['weights'].items()}
+
+
+def random_codes(rng: 'np.random.Generator', n: int) -> 'np.ndarray':
+    """Uniformly random answer codes, 0 meaning an unscored answer"""
+    codes = np.empty((n, len(QUESTIONS)), dtype=np.uint8)
+    for qi, q in enumerate(QUESTIONS):
+        codes[:, qi] = rng.integers(0, len(DEFAULT_RUBRIC['weights'][q]) + 1, n)
+    return codes
+
+
+def synthetic_outcomes(rng: 'np.random.Generator', X: AnswerMatrix, w: 'np.ndarray',
+                       theta: 'np.ndarray') -> 'np.ndarray':
+    """Draw ordinal outcomes from the cumulative logit model"""
+    latent = X.dot(w) + rng.logistic(size=X.shape[0])
+    return np.searchsorted(theta, latent)
+
+
+def check_derivatives(rng: 'np.random.Generator'):
+    """Analytic gradient and Hessian match central finite differences"""
+    X = AnswerMatrix(random_codes(rng, 3000))
+    n_features = X.shape[1]
+    y = rng.integers(0, len(BANDS), X.shape[0])
+    params = np.concatenate([rng.normal(0, 0.3, n_features), [-0.5, 0.3, 1.2]])
+    ridge = 0.5
+
+    def split(b):
+        return b[:n_features], b[n_features:]
+
+    grad, hess = ordinal_derivatives(X, y, len(BANDS), *split(params), ridge)
+    eps = 1e-5
+    numeric_grad = np.empty_like(grad)
+    numeric_hess = np.empty_like(hess)
+    for i in range(len(params)):
+        step = np.zeros_like(params)
+        step[i] = eps
+        numeric_grad[i] = (log_likelihood(X, y, *split(params + step), ridge) -
+                           log_likelihood(X, y, *split(params - step), ridge)) / (2 * eps)
+        numeric_hess[i] = (ordinal_derivatives(X, y, len(BANDS), *split(params + step), ridge)[0] -
+                           ordinal_derivatives(X, y, len(BANDS), *split(params - step), ridge)[0]) / (2 * eps)
+    grad_error = np.abs(numeric_grad - grad).max() / np.abs(grad).max()
+    hess_error = np.abs(numeric_hess - hess).max() / np.abs(hess).max()
+    assert grad_error < 1e-6, f"gradient relative error {grad_error:.2e}"
+    assert hess_error < 1e-6, f"Hessian relative error {hess_error:.2e}"
+    return f"relative error gradient {grad_error:.1e}, Hessian {hess_error:.1e}"
+
+
+def check_recovery(rng: 'np.random.Generator', rows: int):
+    """Known non-negative weights and thresholds are recovered from synthetic data"""
+    X = AnswerMatrix(random_codes(rng, rows))
+    true_w = rng.uniform(0, 1, X.shape[1])
+    true_w[::7] = 0.0
+    true_theta = np.array([3.0, 5.0, 7.0])
+    y = synthetic_outcomes(rng, X, true_w, true_theta)
+    w, theta = fit_nonnegative(X, y, len(BANDS), ridge=1.0)
+    w_error = np.abs(w - true_w).max()
+    theta_error = np.abs(theta - true_theta).max()
+    assert w_error < 0.15, f"weight error {w_error:.3f}"
+    assert theta_error < 0.3, f"threshold error {theta_error:.3f}"
+    return f"{rows} rows, max error weights {w_error:.3f}, thresholds {theta_error:.3f}"
+
+
+def check_constrained_optimum(rng: 'np.random.Generator'):
+    """With correlated answers and negative true weights the fit satisfies the KKT conditions"""
+    codes = random_codes(rng, 20000)
+    codes[:, 1] = np.where(rng.random(len(codes)) < 0.9, codes[:, 0], codes[:, 1])
+    codes[:, 2] = np.where(rng.random(len(codes)) < 0.8, codes[:, 0], codes[:, 2])
+    X = AnswerMatrix(codes)
+    true_w = rng.normal(0.2, 0.8, X.shape[1])
+    y = synthetic_outcomes(rng, X, true_w, np.quantile(X.dot(true_w), [0.3, 0.55, 0.8]))
+    w, theta = fit_nonnegative(X, y, len(BANDS), ridge=1.0)
+    gradient = weight_gradient(X, y, w, theta, ridge=1.0)
+    # Newton stops on the Newton decrement, which leaves gradients of order 1e-6 * rows
+    tol = 1e-5 * len(y)
+    assert np.all(w >= 0), "negative weight"
+    assert np.all(np.abs(gradient[w > 0]) < tol), "free weight not at a stationary point"
+    assert np.all(gradient[w == 0] <= tol), "pinned weight would improve the fit"
+    return f"{int((w == 0).sum())} weights pinned at zero"
+
+
+def check_default_rubric():
+    """DEFAULT_RUBRIC reproduces the scores of the original hard-coded engine"""
+    with open(EXAMPLE, 'r', encoding='utf-8') as f:
+        example = json.load(f)
+    answers = {}
+    for value in example.values():
+        if isinstance(value, dict):
+            answers.update(value)
+
+    report = PlatformAssessment().evaluate(answers)
+    scores = [s['score'] for s in report['category_scores']]
+    assert scores == BASELINE_AIRBNB, f"AirBnB category scores {scores}"
+    assert (report['total_score'], report['max_score']) == (515, 600)
+    assert report['viability'] == 'STRONG'
+
+    best = PlatformAssessment().evaluate(BEST_ANSWERS)
+    assert best['total_score'] == 600 and best['viability'] == 'STRONG'
+
+    empty = PlatformAssessment().evaluate({})
+    assert empty['total_score'] == 0 and empty['viability'] == 'WEAK'
+    assert len(empty['recommendations']) == 7, "expected one recommendation per weak category"
+    return "AirBnB 515/600, best answers 600/600, no answers 0/600"
+
+
+def check_engine_agreement(rng: 'np.random.Generator'):
+    """Vectorised band prediction matches the engine for default and calibrated rubrics"""
+    choices = {q: list(options) + ['no', 'none', ''] for q, options in DEFAULT_RUBRIC['weights'].items()}
+    picker = random.Random(int(rng.integers(1 << 30)))
+    answer_sets = [{q: picker.choice(options) for q, options in choices.items()} for _ in range(2000)]
+    option_codes = {q: {option: code for code, option in enumerate(options, 1)}
+                    for q, options in DEFAULT_RUBRIC['weights'].items()}
+    codes = np.array([[option_codes[q].get(a[q], 0) for q in QUESTIONS] for a in answer_sets],
+                     dtype=np.uint8)
+    X = AnswerMatrix(codes)
+    calibrated = to_rubric(rng.uniform(0, 1, len(FEATURES)), np.array([3.0, 5.0, 7.0]))
+    for rubric in (DEFAULT_RUBRIC, calibrated):
+        predicted = predict_bands(X, rubric)
+        engine = [BANDS.index(PlatformAssessment(rubric).evaluate(a)['viability']) for a in answer_sets]
+        assert np.array_equal(predicted, engine), "band mismatch between calibration and engine"
+    return f"{len(answer_sets)} answer sets, default and calibrated rubrics"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check calibration maths against known results')
+    parser.add_argument('--rows', type=int, default=50000, help='Rows for the weight recovery check')
+    parser.add_argument('--seed', type=int, default=1, help='Random seed')
+
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    checks = [
+        ('Derivatives', lambda: check_derivatives(rng)),
+        ('Weight recovery', lambda: check_recovery(rng, args.rows)),
+        ('Constrained optimum', lambda: check_constrained_optimum(rng)),
+        ('Default rubric', check_default_rubric),
+        ('Engine agreement', lambda: check_engine_agreement(rng)),
+    ]
+    failed = 0
+    for name, check in checks:
+        try:
+            detail = check()
+            print(f"PASS  {name}: {detail}")
+        except AssertionError as e:
+            failed += 1
+            print(f"FAIL  {name}: {e}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,64 +4,162 @@ Platform Launch Analyzer - Core Assessment Engine
 Based on Azoulay & Tucker's Platform Strategy Framework
 """
 
+import io
 import json
 import argparse
 from datetime import datetime
-from typing import Dict, List, Tuple
+from typing import Dict, IO, Iterator, List, Tuple
 import sys
 
+from report_renderers import RENDERERS, get_renderer, write_portfolio
+
+
+# Points awarded per answer and the minimum overall percentage for each
+# viability band. A rubric file with the same shape can replace these.
+DEFAULT_RUBRIC = {
+    'weights': {
+        'sides_defined': {'yes': 20},
+        'value_unit_clear': {'yes': 20},
+        'interaction_designed': {'yes': 20},
+        'governance_defined': {'yes': 20},
+        'control_mechanism': {'yes': 20},
+        'same_side_strength': {'strong': 30, 'moderate': 15},
+        'cross_side_strength': {'strong': 40, 'moderate': 20},
+        'standalone_value': {'yes': 30},
+        'marquee_users': {'yes': 25},
+        'subsidy_strategy': {'strategic': 25, 'minimal': 15},
+        'chicken_egg_solution': {'yes': 30},
+        'single_side_start': {'yes': 20},
+        'multi_homing_costs': {'high': 30, 'moderate': 15},
+        'differentiation': {'yes': 35},
+        'switching_costs': {'high': 35, 'moderate': 20},
+        'reduces_search_costs': {'yes': 35},
+        'reduces_transaction_costs': {'yes': 35},
+        'trust_mechanisms': {'yes': 30},
+        'revenue_model_clear': {'yes': 30},
+        'pricing_side_identified': {'yes': 25},
+        'pricing_structure': {'rake': 25, 'subscription': 25, 'freemium': 25},
+        'pricing_sustainable': {'yes': 20}
+    },
+    'bands': {'STRONG': 75, 'MODERATE': 60, 'QUESTIONABLE': 45}
+}
+
+
+def load_rubric(path: str) -> Dict:
+    """Load a rubric file, e.g. one written by calibrate_weights.py"""
+    with open(path, 'r', encoding='utf-8') as f:
+        rubric = json.load(f)
+    if (not isinstance(rubric, dict) or not isinstance(rubric.get('weights'), dict)
+            or not isinstance(rubric.get('bands'), dict)):
+        raise ValueError(f"{path}: rubric needs 'weights' and 'bands' objects")
+    for question, options in rubric['weights'].items():
+        if question not in DEFAULT_RUBRIC['weights']:
+            raise ValueError(f"{path}: unknown question '{question}' in weights")
+        # Reports print scores as n/max, so points are whole numbers like those
+        # calibrate_weights.py writes
+        if not isinstance(options, dict) or not all(_is_integer(v) for v in options.values()):
+            raise ValueError(f"{path}: weights for '{question}' must map answers to whole-number points")
+        if any(v < 0 for v in options.values()):
+            raise ValueError(f"{path}: weights for '{question}' must not be negative")
+    if sum(max(options.values(), default=0) for options in rubric['weights'].values()) <= 0:
+        raise ValueError(f"{path}: rubric weights award no points")
+    missing = set(DEFAULT_RUBRIC['bands']) - set(rubric['bands'])
+    if missing:
+        raise ValueError(f"{path}: rubric is missing bands {', '.join(sorted(missing))}")
+    for band, threshold in rubric['bands'].items():
+        if not _is_number(threshold):
+            raise ValueError(f"{path}: band '{band}' must be a number")
+    bands = rubric['bands']
+    if not bands['QUESTIONABLE'] <= bands['MODERATE'] <= bands['STRONG']:
+        raise ValueError(f"{path}: bands must be ordered QUESTIONABLE <= MODERATE <= STRONG")
+    return rubric
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _is_integer(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
 
 class PlatformAssessment:
     """Evaluates platform ideas against key success criteria"""
     
-    def __init__(self):
+    def __init__(self, rubric: Dict = None):
+        self.rubric = rubric or DEFAULT_RUBRIC
         self.scores = {}
         self.recommendations = []
         self.risks = []
         self.strengths = []
         
+    def points(self, question: str, answer: str) -> float:
+        """Points the rubric awards for an answer"""
+        return self.rubric['weights'].get(question, {}).get(answer, 0)
+    
+    def max_points(self, *questions: str) -> float:
+        """Best achievable points across a set of questions"""
+        return sum(max([0, *self.rubric['weights'].get(q, {}).values()]) for q in questions)
+    
+    def _award(self, feedback: List[str], question: str, answer: str, message: str,
+               strength: str = None) -> float:
+        """Points for an answer, noting it in feedback and strengths only if it earns any"""
+        points = self.points(question, answer)
+        if points > 0:
+            feedback.append(message)
+            if strength:
+                self.strengths.append(strength)
+        return points
+    
+    def _shortfall(self, feedback: List[str], question: str, message: str, risk: str = None):
+        """Note a missed answer, unless the rubric gives the question no points at all"""
+        if self.max_points(question) > 0:
+            feedback.append(message)
+            if risk:
+                self.risks.append(risk)
+    
     def assess_core_definition(self, answers: Dict) -> Dict:
         """Evaluate platform core definition quality"""
         score = 0
-        max_score = 100
+        max_score = self.max_points('sides_defined', 'value_unit_clear', 'interaction_designed',
+                                    'governance_defined', 'control_mechanism')
         feedback = []
         
         # Check if sides are clearly defined
         if answers.get('sides_defined', '').lower() == 'yes':
-            score += 20
-            feedback.append("✓ Clear identification of platform sides")
+            score += self._award(feedback, 'sides_defined', 'yes',
+                                 "✓ Clear identification of platform sides")
         else:
-            feedback.append("✗ Platform sides need clearer definition")
-            self.risks.append("Unclear platform sides - fundamental issue")
+            self._shortfall(feedback, 'sides_defined', "✗ Platform sides need clearer definition",
+                            "Unclear platform sides - fundamental issue")
         
         # Check value unit clarity
         if answers.get('value_unit_clear', '').lower() == 'yes':
-            score += 20
-            feedback.append("✓ Value unit well-defined")
+            score += self._award(feedback, 'value_unit_clear', 'yes', "✓ Value unit well-defined")
         else:
-            feedback.append("✗ Value unit needs clarification")
+            self._shortfall(feedback, 'value_unit_clear', "✗ Value unit needs clarification")
             
         # Check interaction design
         if answers.get('interaction_designed', '').lower() == 'yes':
-            score += 20
-            feedback.append("✓ Core interaction properly designed")
+            score += self._award(feedback, 'interaction_designed', 'yes',
+                                 "✓ Core interaction properly designed")
         else:
-            feedback.append("✗ Core interaction needs more work")
+            self._shortfall(feedback, 'interaction_designed', "✗ Core interaction needs more work")
         
         # Check governance rules
         if answers.get('governance_defined', '').lower() == 'yes':
-            score += 20
-            feedback.append("✓ Governance rules established")
+            score += self._award(feedback, 'governance_defined', 'yes',
+                                 "✓ Governance rules established")
         else:
-            feedback.append("✗ Governance structure needs development")
+            self._shortfall(feedback, 'governance_defined', "✗ Governance structure needs development")
             
         # Check control mechanisms
         if answers.get('control_mechanism', '').lower() == 'yes':
-            score += 20
-            feedback.append("✓ Control mechanisms identified")
+            score += self._award(feedback, 'control_mechanism', 'yes',
+                                 "✓ Control mechanisms identified")
         else:
-            feedback.append("✗ Need strategy for maintaining control")
-            self.risks.append("Lack of platform control strategy")
+            self._shortfall(feedback, 'control_mechanism', "✗ Need strategy for maintaining control",
+                            "Lack of platform control strategy")
         
         return {
             'score': score,
@@ -73,41 +171,41 @@ class PlatformAssessment:
     def assess_network_effects(self, answers: Dict) -> Dict:
         """Evaluate network effects potential"""
         score = 0
-        max_score = 100
+        max_score = self.max_points('same_side_strength', 'cross_side_strength', 'standalone_value')
         feedback = []
         
         # Same-side network effects
         same_side_strength = answers.get('same_side_strength', 'none')
         if same_side_strength == 'strong':
-            score += 30
-            feedback.append("✓ Strong same-side network effects")
-            self.strengths.append("Strong same-side network effects")
+            score += self._award(feedback, 'same_side_strength', 'strong',
+                                 "✓ Strong same-side network effects",
+                                 "Strong same-side network effects")
         elif same_side_strength == 'moderate':
-            score += 15
-            feedback.append("◐ Moderate same-side network effects")
+            score += self._award(feedback, 'same_side_strength', 'moderate',
+                                 "◐ Moderate same-side network effects")
         else:
-            feedback.append("✗ Weak/no same-side network effects")
+            self._shortfall(feedback, 'same_side_strength', "✗ Weak/no same-side network effects")
         
         # Cross-side network effects  
         cross_side_strength = answers.get('cross_side_strength', 'none')
         if cross_side_strength == 'strong':
-            score += 40
-            feedback.append("✓ Strong cross-side network effects")
-            self.strengths.append("Strong cross-side network effects")
+            score += self._award(feedback, 'cross_side_strength', 'strong',
+                                 "✓ Strong cross-side network effects",
+                                 "Strong cross-side network effects")
         elif cross_side_strength == 'moderate':
-            score += 20
-            feedback.append("◐ Moderate cross-side network effects")
+            score += self._award(feedback, 'cross_side_strength', 'moderate',
+                                 "◐ Moderate cross-side network effects")
         else:
-            feedback.append("✗ Weak/no cross-side network effects")
-            self.risks.append("Weak network effects may limit growth")
+            self._shortfall(feedback, 'cross_side_strength', "✗ Weak/no cross-side network effects",
+                            "Weak network effects may limit growth")
         
         # Stand-alone value
         if answers.get('standalone_value', '').lower() == 'yes':
-            score += 30
-            feedback.append("✓ Platform offers stand-alone value")
-            self.strengths.append("Strong stand-alone value proposition")
+            score += self._award(feedback, 'standalone_value', 'yes',
+                                 "✓ Platform offers stand-alone value",
+                                 "Strong stand-alone value proposition")
         else:
-            feedback.append("⚠ Limited stand-alone value - harder to seed")
+            self._shortfall(feedback, 'standalone_value', "⚠ Limited stand-alone value - harder to seed")
             
         return {
             'score': score,
@@ -119,38 +217,39 @@ class PlatformAssessment:
     def assess_seeding_strategy(self, answers: Dict) -> Dict:
         """Evaluate platform seeding approach"""
         score = 0
-        max_score = 100
+        max_score = self.max_points('marquee_users', 'subsidy_strategy',
+                                    'chicken_egg_solution', 'single_side_start')
         feedback = []
         
         # Marquee users strategy
         if answers.get('marquee_users', '').lower() == 'yes':
-            score += 25
-            feedback.append("✓ Marquee user strategy identified")
+            score += self._award(feedback, 'marquee_users', 'yes',
+                                 "✓ Marquee user strategy identified")
         
         # Subsidy strategy
         subsidy = answers.get('subsidy_strategy', 'none')
         if subsidy == 'strategic':
-            score += 25
-            feedback.append("✓ Strategic subsidization planned")
+            score += self._award(feedback, 'subsidy_strategy', 'strategic',
+                                 "✓ Strategic subsidization planned")
         elif subsidy == 'minimal':
-            score += 15
-            feedback.append("◐ Limited subsidization planned")
+            score += self._award(feedback, 'subsidy_strategy', 'minimal',
+                                 "◐ Limited subsidization planned")
         else:
-            feedback.append("⚠ No clear subsidization strategy")
+            self._shortfall(feedback, 'subsidy_strategy', "⚠ No clear subsidization strategy")
         
         # Chicken-egg solution
         if answers.get('chicken_egg_solution', '').lower() == 'yes':
-            score += 30
-            feedback.append("✓ Clear solution to chicken-egg problem")
-            self.strengths.append("Solid chicken-egg problem solution")
+            score += self._award(feedback, 'chicken_egg_solution', 'yes',
+                                 "✓ Clear solution to chicken-egg problem",
+                                 "Solid chicken-egg problem solution")
         else:
-            feedback.append("✗ Chicken-egg problem not addressed")
-            self.risks.append("No clear path to overcome chicken-egg problem")
+            self._shortfall(feedback, 'chicken_egg_solution', "✗ Chicken-egg problem not addressed",
+                            "No clear path to overcome chicken-egg problem")
         
         # Single-side focus option
         if answers.get('single_side_start', '').lower() == 'yes':
-            score += 20
-            feedback.append("✓ Can start with single-side focus")
+            score += self._award(feedback, 'single_side_start', 'yes',
+                                 "✓ Can start with single-side focus")
         
         return {
             'score': score,
@@ -162,40 +261,40 @@ class PlatformAssessment:
     def assess_competitive_dynamics(self, answers: Dict) -> Dict:
         """Evaluate competitive positioning and tipping potential"""
         score = 0
-        max_score = 100
+        max_score = self.max_points('multi_homing_costs', 'differentiation', 'switching_costs')
         feedback = []
         
         # Multi-homing costs
         multi_homing = answers.get('multi_homing_costs', 'low')
         if multi_homing == 'high':
-            score += 30
-            feedback.append("✓ High multi-homing costs favor winner-take-all")
-            self.strengths.append("High multi-homing costs create defensibility")
+            score += self._award(feedback, 'multi_homing_costs', 'high',
+                                 "✓ High multi-homing costs favor winner-take-all",
+                                 "High multi-homing costs create defensibility")
         elif multi_homing == 'moderate':
-            score += 15
-            feedback.append("◐ Moderate multi-homing costs")
+            score += self._award(feedback, 'multi_homing_costs', 'moderate',
+                                 "◐ Moderate multi-homing costs")
         else:
-            feedback.append("⚠ Low multi-homing costs enable competition")
-            self.risks.append("Low barriers to multi-platform usage")
+            self._shortfall(feedback, 'multi_homing_costs', "⚠ Low multi-homing costs enable competition",
+                            "Low barriers to multi-platform usage")
         
         # Differentiation
         if answers.get('differentiation', '').lower() == 'yes':
-            score += 35
-            feedback.append("✓ Clear differentiation from competitors")
+            score += self._award(feedback, 'differentiation', 'yes',
+                                 "✓ Clear differentiation from competitors")
         else:
-            feedback.append("✗ Weak differentiation")
-            self.risks.append("Insufficient differentiation from competitors")
+            self._shortfall(feedback, 'differentiation', "✗ Weak differentiation",
+                            "Insufficient differentiation from competitors")
         
         # Switching costs
         switching = answers.get('switching_costs', 'low')
         if switching == 'high':
-            score += 35
-            feedback.append("✓ High switching costs create lock-in")
+            score += self._award(feedback, 'switching_costs', 'high',
+                                 "✓ High switching costs create lock-in")
         elif switching == 'moderate':
-            score += 20
-            feedback.append("◐ Moderate switching costs")
+            score += self._award(feedback, 'switching_costs', 'moderate',
+                                 "◐ Moderate switching costs")
         else:
-            feedback.append("⚠ Low switching costs increase churn risk")
+            self._shortfall(feedback, 'switching_costs', "⚠ Low switching costs increase churn risk")
         
         return {
             'score': score,
@@ -207,32 +306,33 @@ class PlatformAssessment:
     def assess_value_creation(self, answers: Dict) -> Dict:
         """Evaluate value creation mechanisms"""
         score = 0
-        max_score = 100
+        max_score = self.max_points('reduces_search_costs', 'reduces_transaction_costs',
+                                    'trust_mechanisms')
         feedback = []
         
         # Search cost reduction
         if answers.get('reduces_search_costs', '').lower() == 'yes':
-            score += 35
-            feedback.append("✓ Significantly reduces search costs")
-            self.strengths.append("Strong search cost reduction")
+            score += self._award(feedback, 'reduces_search_costs', 'yes',
+                                 "✓ Significantly reduces search costs",
+                                 "Strong search cost reduction")
         else:
-            feedback.append("◐ Limited search cost reduction")
+            self._shortfall(feedback, 'reduces_search_costs', "◐ Limited search cost reduction")
         
         # Transaction cost reduction
         if answers.get('reduces_transaction_costs', '').lower() == 'yes':
-            score += 35
-            feedback.append("✓ Significantly reduces transaction costs")
-            self.strengths.append("Strong transaction cost reduction")
+            score += self._award(feedback, 'reduces_transaction_costs', 'yes',
+                                 "✓ Significantly reduces transaction costs",
+                                 "Strong transaction cost reduction")
         else:
-            feedback.append("◐ Limited transaction cost reduction")
+            self._shortfall(feedback, 'reduces_transaction_costs', "◐ Limited transaction cost reduction")
         
         # Trust and safety
         if answers.get('trust_mechanisms', '').lower() == 'yes':
-            score += 30
-            feedback.append("✓ Strong trust and safety mechanisms")
+            score += self._award(feedback, 'trust_mechanisms', 'yes',
+                                 "✓ Strong trust and safety mechanisms")
         else:
-            feedback.append("✗ Trust and safety needs attention")
-            self.risks.append("Insufficient trust and safety mechanisms")
+            self._shortfall(feedback, 'trust_mechanisms', "✗ Trust and safety needs attention",
+                            "Insufficient trust and safety mechanisms")
         
         return {
             'score': score,
@@ -244,38 +344,38 @@ class PlatformAssessment:
     def assess_pricing_strategy(self, answers: Dict) -> Dict:
         """Evaluate pricing and monetization approach"""
         score = 0
-        max_score = 100
+        max_score = self.max_points('revenue_model_clear', 'pricing_side_identified',
+                                    'pricing_structure', 'pricing_sustainable')
         feedback = []
         
         # Revenue model clarity
         if answers.get('revenue_model_clear', '').lower() == 'yes':
-            score += 30
-            feedback.append("✓ Clear revenue model")
+            score += self._award(feedback, 'revenue_model_clear', 'yes', "✓ Clear revenue model")
         else:
-            feedback.append("✗ Revenue model needs clarification")
-            self.risks.append("Unclear path to monetization")
+            self._shortfall(feedback, 'revenue_model_clear', "✗ Revenue model needs clarification",
+                            "Unclear path to monetization")
         
         # Side to charge identified
         if answers.get('pricing_side_identified', '').lower() == 'yes':
-            score += 25
-            feedback.append("✓ Correct side identified for pricing")
+            score += self._award(feedback, 'pricing_side_identified', 'yes',
+                                 "✓ Correct side identified for pricing")
         else:
-            feedback.append("✗ Unclear which side to charge")
+            self._shortfall(feedback, 'pricing_side_identified', "✗ Unclear which side to charge")
         
         # Pricing structure
         pricing_type = answers.get('pricing_structure', 'undefined')
         if pricing_type in ['rake', 'subscription', 'freemium']:
-            score += 25
-            feedback.append(f"✓ {pricing_type.capitalize()} model selected")
+            score += self._award(feedback, 'pricing_structure', pricing_type,
+                                 f"✓ {pricing_type.capitalize()} model selected")
         else:
-            feedback.append("✗ Pricing structure undefined")
+            self._shortfall(feedback, 'pricing_structure', "✗ Pricing structure undefined")
         
         # Sustainability
         if answers.get('pricing_sustainable', '').lower() == 'yes':
-            score += 20
-            feedback.append("✓ Pricing model appears sustainable")
+            score += self._award(feedback, 'pricing_sustainable', 'yes',
+                                 "✓ Pricing model appears sustainable")
         else:
-            feedback.append("⚠ Sustainability concerns with pricing")
+            self._shortfall(feedback, 'pricing_sustainable', "⚠ Sustainability concerns with pricing")
         
         return {
             'score': score,
@@ -284,6 +384,17 @@ class PlatformAssessment:
             'category': 'Pricing Strategy'
         }
     
+    def viability_band(self, percentage: float) -> str:
+        """Classify an overall percentage into a viability band"""
+        bands = self.rubric['bands']
+        if percentage >= bands['STRONG']:
+            return 'STRONG'
+        elif percentage >= bands['MODERATE']:
+            return 'MODERATE'
+        elif percentage >= bands['QUESTIONABLE']:
+            return 'QUESTIONABLE'
+        return 'WEAK'
+    
     def generate_recommendations(self, all_scores: List[Dict]) -> List[str]:
         """Generate strategic recommendations based on assessment"""
         recommendations = []
@@ -292,17 +403,21 @@ class PlatformAssessment:
         percentage = (total_score / max_total) * 100
         
         # Overall viability
-        if percentage >= 75:
+        band = self.viability_band(percentage)
+        if band == 'STRONG':
             recommendations.append("STRONG VIABILITY: Platform shows excellent potential across key dimensions")
-        elif percentage >= 60:
+        elif band == 'MODERATE':
             recommendations.append("MODERATE VIABILITY: Platform has promise but needs refinement in key areas")
-        elif percentage >= 45:
+        elif band == 'QUESTIONABLE':
             recommendations.append("QUESTIONABLE VIABILITY: Significant challenges need addressing")
         else:
             recommendations.append("WEAK VIABILITY: Fundamental issues suggest reconsidering platform approach")
         
         # Category-specific recommendations
         for score_dict in all_scores:
+            # A category the rubric does not score cannot be weak
+            if not score_dict['max_score']:
+                continue
             cat_percentage = (score_dict['score'] / score_dict['max_score']) * 100
             category = score_dict['category']
             
@@ -318,8 +433,23 @@ class PlatformAssessment:
         
         return recommendations
     
-    def generate_report(self, answers: Dict, output_format: str = 'text') -> str:
-        """Generate comprehensive assessment report"""
+    def generate_next_steps(self, percentage: float) -> List[str]:
+        """Suggest next steps for the overall percentage"""
+        band = self.viability_band(percentage)
+        if band == 'STRONG':
+            return ["Proceed with detailed business plan development",
+                    "Begin prototype/MVP development",
+                    "Identify and approach marquee users"]
+        elif band == 'MODERATE':
+            return ["Address identified weaknesses before proceeding",
+                    "Refine platform core and governance model",
+                    "Strengthen network effects mechanisms"]
+        return ["Reconsider platform approach vs. traditional business model",
+                "If proceeding, fundamental redesign recommended",
+                "Consider pivoting to address stronger pain points"]
+    
+    def evaluate(self, answers: Dict) -> Dict:
+        """Run all assessments and collect the results for rendering"""
         
         # Run all assessments
         scores = []
@@ -333,108 +463,90 @@ class PlatformAssessment:
         # Calculate totals
         total_score = sum(s['score'] for s in scores)
         max_total = sum(s['max_score'] for s in scores)
-        overall_percentage = (total_score / max_total) * 100
-        
-        # Get recommendations
-        recommendations = self.generate_recommendations(scores)
-        
-        if output_format == 'json':
-            return json.dumps({
-                'timestamp': datetime.now().isoformat(),
-                'overall_score': f"{total_score}/{max_total}",
-                'overall_percentage': round(overall_percentage, 1),
-                'category_scores': scores,
-                'strengths': self.strengths,
-                'risks': self.risks,
-                'recommendations': recommendations
-            }, indent=2)
-        
-        # Generate text report
-        report = []
-        report.append("=" * 70)
-        report.append("PLATFORM LAUNCH ASSESSMENT REPORT")
-        report.append("=" * 70)
-        report.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report.append("")
-        
-        # Overall Score
-        report.append(f"OVERALL VIABILITY SCORE: {total_score}/{max_total} ({overall_percentage:.1f}%)")
-        report.append("")
-        
-        # Score visualization
-        bar_length = 50
-        filled = int((overall_percentage / 100) * bar_length)
-        bar = "█" * filled + "░" * (bar_length - filled)
-        report.append(f"[{bar}] {overall_percentage:.1f}%")
-        report.append("")
-        
-        # Category breakdowns
-        report.append("CATEGORY ASSESSMENTS")
-        report.append("-" * 70)
-        for score_dict in scores:
-            cat_percent = (score_dict['score'] / score_dict['max_score']) * 100
-            report.append(f"\n{score_dict['category']}: {score_dict['score']}/{score_dict['max_score']} ({cat_percent:.1f}%)")
-            for feedback in score_dict['feedback']:
-                report.append(f"  {feedback}")
-        
-        # Strengths
-        if self.strengths:
-            report.append("\n" + "=" * 70)
-            report.append("KEY STRENGTHS")
-            report.append("-" * 70)
-            for strength in self.strengths:
-                report.append(f"• {strength}")
-        
-        # Risks
-        if self.risks:
-            report.append("\n" + "=" * 70)
-            report.append("CRITICAL RISKS")
-            report.append("-" * 70)
-            for risk in self.risks:
-                report.append(f"⚠ {risk}")
-        
-        # Recommendations
-        report.append("\n" + "=" * 70)
-        report.append("STRATEGIC RECOMMENDATIONS")
-        report.append("-" * 70)
-        for i, rec in enumerate(recommendations, 1):
-            report.append(f"{i}. {rec}")
-        
-        # Next steps
-        report.append("\n" + "=" * 70)
-        report.append("SUGGESTED NEXT STEPS")
-        report.append("-" * 70)
-        
-        if overall_percentage >= 75:
-            report.append("1. Proceed with detailed business plan development")
-            report.append("2. Begin prototype/MVP development")
-            report.append("3. Identify and approach marquee users")
-        elif overall_percentage >= 60:
-            report.append("1. Address identified weaknesses before proceeding")
-            report.append("2. Refine platform core and governance model")
-            report.append("3. Strengthen network effects mechanisms")
-        else:
-            report.append("1. Reconsider platform approach vs. traditional business model")
-            report.append("2. If proceeding, fundamental redesign recommended")
-            report.append("3. Consider pivoting to address stronger pain points")
-        
-        report.append("\n" + "=" * 70)
+        overall_percentage = (total_score / max_total) * 100 if max_total else 0.0
         
-        return "\n".join(report)
+        return {
+            'platform_name': answers.get('platform_name'),
+            'generated': datetime.now(),
+            'total_score': total_score,
+            'max_score': max_total,
+            'percentage': overall_percentage,
+            'viability': self.viability_band(overall_percentage),
+            'category_scores': scores,
+            'strengths': self.strengths,
+            'risks': self.risks,
+            'recommendations': self.generate_recommendations(scores),
+            'next_steps': self.generate_next_steps(overall_percentage)
+        }
+    
+    def write_report(self, answers: Dict, stream: IO[str], output_format: str = 'text'):
+        """Evaluate answers and stream the report to a file-like object"""
+        get_renderer(output_format).write_report(self.evaluate(answers), stream)
+    
+    def generate_report(self, answers: Dict, output_format: str = 'text') -> str:
+        """Generate comprehensive assessment report"""
+        buffer = io.StringIO()
+        self.write_report(answers, buffer, output_format)
+        return buffer.getvalue().rstrip("\n")
+
+
+def iter_portfolio(path: str, rubric: Dict = None) -> Iterator[Dict]:
+    """Yield evaluated assessments from an NDJSON file, one answers object per line"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line_number, line in enumerate(f, 1):
+            if not line.strip():
+                continue
+            try:
+                answers = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: invalid JSON ({e})") from None
+            if not isinstance(answers, dict):
+                raise ValueError(f"{path}:{line_number}: expected a JSON object of answers")
+            if not isinstance(answers.get('platform_name') or '', str):
+                raise ValueError(f"{path}:{line_number}: platform_name must be a string")
+            yield PlatformAssessment(rubric).evaluate(answers)
 
 
 def main():
     parser = argparse.ArgumentParser(description='Platform Launch Assessment Tool')
     parser.add_argument('--input', '-i', help='JSON file with assessment answers')
     parser.add_argument('--output', '-o', help='Output file for report')
-    parser.add_argument('--format', '-f', choices=['text', 'json'], default='text',
+    parser.add_argument('--format', '-f', choices=sorted(RENDERERS), default='text',
                        help='Output format')
     parser.add_argument('--interactive', action='store_true',
                        help='Run interactive assessment')
+    parser.add_argument('--portfolio', '-p',
+                       help='NDJSON file with one set of answers per line; renders a combined report')
+    parser.add_argument('--rubric', '-r',
+                       help='Rubric JSON file with calibrated weights and bands (see calibrate_weights.py)')
     
     args = parser.parse_args()
     
-    assessor = PlatformAssessment()
+    rubric = None
+    if args.rubric:
+        try:
+            rubric = load_rubric(args.rubric)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+    
+    assessor = PlatformAssessment(rubric)
+    
+    if args.portfolio:
+        # Portfolio mode - stream every assessment into one document
+        stream = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+        try:
+            summary = write_portfolio(iter_portfolio(args.portfolio, rubric), get_renderer(args.format), stream)
+        except (OSError, ValueError) as e:
+            # stdout may hold a half-written document, so report on stderr
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        finally:
+            if args.output:
+                stream.close()
+        if args.output:
+            print(f"Portfolio report ({summary['count']} assessments) saved to: {args.output}")
+        return
     
     if args.interactive:
         # Interactive mode - ask questions
@@ -496,19 +608,16 @@ def main():
         with open(args.input, 'r') as f:
             answers = json.load(f)
     else:
-        print("Error: Provide either --input file or use --interactive mode")
+        print("Error: Provide --input file, --portfolio file or use --interactive mode")
         sys.exit(1)
     
-    # Generate report
-    report = assessor.generate_report(answers, args.format)
-    
-    # Output report
+    # Stream report to its destination
     if args.output:
-        with open(args.output, 'w') as f:
-            f.write(report)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            assessor.write_report(answers, f, args.format)
         print(f"Report saved to: {args.output}")
     else:
-        print(report)
+        assessor.write_report(answers, sys.stdout, args.format)
 
 
 if __name__ == '__main__':
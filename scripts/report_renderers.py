@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+Platform Launch Analyzer - Report Renderers
+Streams evaluated assessments to text, JSON, NDJSON, Markdown and HTML
+"""
+
+import json
+import re
+from html import escape
+from typing import Dict, IO, List, Optional
+
+
+RULE = "=" * 70
+SUBRULE = "-" * 70
+BAR_LENGTH = 50
+
+# Templates are bound once at import time and reused for every report
+_TEXT_HEADER = (RULE + "\nPLATFORM LAUNCH ASSESSMENT REPORT\n" + RULE +
+                "\nGenerated: {generated}\n\n"
+                "OVERALL VIABILITY SCORE: {total}/{max} ({percentage:.1f}%)\n\n"
+                "[{bar}] {percentage:.1f}%\n\n"
+                "CATEGORY ASSESSMENTS\n" + SUBRULE + "\n").format
+_TEXT_SECTION = ("\n" + RULE + "\n{title}\n" + SUBRULE + "\n").format
+_TEXT_CATEGORY = "\n{category}: {score}/{max_score} ({percentage:.1f}%)\n".format
+_TEXT_SUMMARY = (RULE + "\nPORTFOLIO SUMMARY\n" + SUBRULE + "\n"
+                 "Assessments: {count}\n"
+                 "Average viability: {average_percentage:.1f}%\n"
+                 "Range: {min_percentage:.1f}% - {max_percentage:.1f}%\n").format
+
+_MD_HEADER = ("{heading} Platform Launch Assessment{name}\n\n"
+              "_Generated: {generated}_\n\n"
+              "**Overall viability score:** {total}/{max} ({percentage:.1f}%) "
+              "— {viability}\n\n"
+              "| Category | Score | % |\n"
+              "|---|---:|---:|\n").format
+_MD_ROW = "| {category} | {score}/{max_score} | {percentage:.1f}% |\n".format
+_MD_SECTION = "\n{heading} {title}\n\n".format
+
+_HTML_DOCUMENT_START = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="UTF-8">
+<title>{title}</title>
+<style>
+body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; max-width: 960px; margin: 2rem auto; color: #141413; background: #faf9f5; }}
+section.assessment {{ border-bottom: 1px solid #e5e2da; padding-bottom: 1rem; }}
+table {{ border-collapse: collapse; }}
+th, td {{ padding: 0.25rem 0.75rem; border-bottom: 1px solid #e5e2da; text-align: left; }}
+.bar {{ background: #e5e2da; height: 0.75rem; width: 20rem; }}
+.bar span {{ display: block; height: 100%; background: #d97757; }}
+</style>
+</head>
+<body>
+""".format
+_HTML_DOCUMENT_END = "</body>\n</html>\n"
+_HTML_HEADER = ("<section class=\"assessment\">\n"
+                "<h{level}>Platform Launch Assessment{name}</h{level}>\n"
+                "<p><em>Generated: {generated}</em></p>\n"
+                "<p><strong>Overall viability score:</strong> {total}/{max} "
+                "({percentage:.1f}%) &mdash; {viability}</p>\n"
+                "<div class=\"bar\"><span style=\"width: {percentage:.1f}%\"></span></div>\n"
+                "<table>\n<tr><th>Category</th><th>Score</th><th>%</th></tr>\n").format
+_HTML_ROW = "<tr><td>{category}</td><td>{score}/{max_score}</td><td>{percentage:.1f}%</td></tr>\n".format
+_HTML_SECTION = "<h{level}>{title}</h{level}>\n<{tag}>\n".format
+
+# Inline Markdown syntax (emphasis, code, links, tables, headings) in user text
+_MD_SPECIAL = re.compile(r'([\\`*_\[\]|#~])')
+
+_PRETTY_ENCODER = json.JSONEncoder(indent=2)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(',', ':'), ensure_ascii=False)
+
+
+def _category_percentage(score_dict: Dict) -> float:
+    if not score_dict['max_score']:
+        return 0.0
+    return (score_dict['score'] / score_dict['max_score']) * 100
+
+
+def _md_escape(text: str) -> str:
+    """Escape inline HTML and Markdown syntax so text renders literally"""
+    return _MD_SPECIAL.sub(r'\\\1', escape(str(text), quote=False))
+
+
+def _json_payload(report: Dict, include_name: bool = False) -> Dict:
+    """Build the public JSON shape of an evaluated assessment"""
+    payload = {}
+    if include_name and report.get('platform_name'):
+        payload['platform_name'] = report['platform_name']
+    payload.update({
+        'timestamp': report['generated'].isoformat(),
+        'overall_score': f"{report['total_score']}/{report['max_score']}",
+        'overall_percentage': round(report['percentage'], 1),
+        'category_scores': report['category_scores'],
+        'strengths': report['strengths'],
+        'risks': report['risks'],
+        'recommendations': report['recommendations']
+    })
+    return payload
+
+
+class PortfolioSummary:
+    """Running totals for a portfolio report, kept in constant memory"""
+
+    def __init__(self):
+        self.count = 0
+        self.total_percentage = 0.0
+        self.min_percentage = None
+        self.max_percentage = None
+        self.viability_counts = {}
+
+    def add(self, report: Dict):
+        percentage = report['percentage']
+        self.count += 1
+        self.total_percentage += percentage
+        if self.min_percentage is None or percentage < self.min_percentage:
+            self.min_percentage = percentage
+        if self.max_percentage is None or percentage > self.max_percentage:
+            self.max_percentage = percentage
+        viability = report['viability']
+        self.viability_counts[viability] = self.viability_counts.get(viability, 0) + 1
+
+    def as_dict(self) -> Dict:
+        return {
+            'count': self.count,
+            'average_percentage': round(self.total_percentage / self.count, 1) if self.count else 0.0,
+            'min_percentage': round(self.min_percentage or 0.0, 1),
+            'max_percentage': round(self.max_percentage or 0.0, 1),
+            'viability_counts': dict(self.viability_counts)
+        }
+
+
+class ReportRenderer:
+    """Base renderer: writes evaluated assessments to a text stream"""
+
+    name = ''
+
+    def write_report(self, report: Dict, stream: IO[str]):
+        """Write a single assessment as a complete document"""
+        raise NotImplementedError
+
+    def begin_portfolio(self, stream: IO[str]):
+        """Write anything that precedes the first portfolio entry"""
+
+    def write_entry(self, report: Dict, index: int, stream: IO[str]):
+        """Write one assessment inside a portfolio document"""
+        self.write_report(report, stream)
+
+    def end_portfolio(self, summary: Dict, stream: IO[str]):
+        """Write the portfolio summary and close the document"""
+
+
+class TextRenderer(ReportRenderer):
+    """Plain text report, as printed to the terminal"""
+
+    name = 'text'
+
+    def write_report(self, report: Dict, stream: IO[str]):
+        write = stream.write
+        percentage = report['percentage']
+        filled = int((percentage / 100) * BAR_LENGTH)
+        write(_TEXT_HEADER(generated=report['generated'].strftime('%Y-%m-%d %H:%M:%S'),
+                           total=report['total_score'], max=report['max_score'],
+                           percentage=percentage,
+                           bar="█" * filled + "░" * (BAR_LENGTH - filled)))
+
+        for score_dict in report['category_scores']:
+            write(_TEXT_CATEGORY(percentage=_category_percentage(score_dict), **score_dict))
+            for feedback in score_dict['feedback']:
+                write(f"  {feedback}\n")
+
+        if report['strengths']:
+            write(_TEXT_SECTION(title="KEY STRENGTHS"))
+            for strength in report['strengths']:
+                write(f"• {strength}\n")
+
+        if report['risks']:
+            write(_TEXT_SECTION(title="CRITICAL RISKS"))
+            for risk in report['risks']:
+                write(f"⚠ {risk}\n")
+
+        write(_TEXT_SECTION(title="STRATEGIC RECOMMENDATIONS"))
+        for i, rec in enumerate(report['recommendations'], 1):
+            write(f"{i}. {rec}\n")
+
+        write(_TEXT_SECTION(title="SUGGESTED NEXT STEPS"))
+        for i, step in enumerate(report['next_steps'], 1):
+            write(f"{i}. {step}\n")
+
+        write("\n" + RULE + "\n")
+
+    def write_entry(self, report: Dict, index: int, stream: IO[str]):
+        if report.get('platform_name'):
+            stream.write(f"#{index} {report['platform_name']}\n")
+        self.write_report(report, stream)
+        stream.write("\n")
+
+    def end_portfolio(self, summary: Dict, stream: IO[str]):
+        stream.write(_TEXT_SUMMARY(**summary))
+        for viability, count in sorted(summary['viability_counts'].items()):
+            stream.write(f"  {viability}: {count}\n")
+        stream.write(RULE + "\n")
+
+
+class JSONRenderer(ReportRenderer):
+    """Indented JSON; portfolios are a single object with an assessments array"""
+
+    name = 'json'
+
+    def write_report(self, report: Dict, stream: IO[str]):
+        stream.write(_PRETTY_ENCODER.encode(_json_payload(report)))
+        stream.write("\n")
+
+    def begin_portfolio(self, stream: IO[str]):
+        stream.write('{\n"assessments": [\n')
+
+    def write_entry(self, report: Dict, index: int, stream: IO[str]):
+        if index > 1:
+            stream.write(",\n")
+        stream.write(_PRETTY_ENCODER.encode(_json_payload(report, include_name=True)))
+
+    def end_portfolio(self, summary: Dict, stream: IO[str]):
+        stream.write('\n],\n"summary": ')
+        stream.write(_PRETTY_ENCODER.encode(summary))
+        stream.write("\n}\n")
+
+
+class NDJSONRenderer(ReportRenderer):
+    """Compact newline-delimited JSON, one assessment per line"""
+
+    name = 'ndjson'
+
+    def write_report(self, report: Dict, stream: IO[str]):
+        stream.write(_COMPACT_ENCODER.encode(_json_payload(report, include_name=True)))
+        stream.write("\n")
+
+    def end_portfolio(self, summary: Dict, stream: IO[str]):
+        stream.write(_COMPACT_ENCODER.encode({'summary': summary}))
+        stream.write("\n")
+
+
+class MarkdownRenderer(ReportRenderer):
+    """GitHub-flavored Markdown for the portal"""
+
+    name = 'markdown'
+
+    def write_report(self, report: Dict, stream: IO[str], heading: str = '#'):
+        write = stream.write
+        name = report.get('platform_name')
+        write(_MD_HEADER(heading=heading, name=f": {_md_escape(name)}" if name else '',
+                         generated=report['generated'].strftime('%Y-%m-%d %H:%M:%S'),
+                         total=report['total_score'], max=report['max_score'],
+                         percentage=report['percentage'], viability=report['viability']))
+        for score_dict in report['category_scores']:
+            write(_MD_ROW(category=_md_escape(score_dict['category']), score=score_dict['score'],
+                          max_score=score_dict['max_score'],
+                          percentage=_category_percentage(score_dict)))
+
+        sub = heading + '#'
+        for score_dict in report['category_scores']:
+            write(_MD_SECTION(heading=sub, title=_md_escape(score_dict['category'])))
+            for feedback in score_dict['feedback']:
+                write(f"- {_md_escape(feedback)}\n")
+
+        if report['strengths']:
+            write(_MD_SECTION(heading=sub, title="Key Strengths"))
+            for strength in report['strengths']:
+                write(f"- {_md_escape(strength)}\n")
+
+        if report['risks']:
+            write(_MD_SECTION(heading=sub, title="Critical Risks"))
+            for risk in report['risks']:
+                write(f"- ⚠ {_md_escape(risk)}\n")
+
+        write(_MD_SECTION(heading=sub, title="Strategic Recommendations"))
+        for i, rec in enumerate(report['recommendations'], 1):
+            write(f"{i}. {_md_escape(rec)}\n")
+
+        write(_MD_SECTION(heading=sub, title="Suggested Next Steps"))
+        for i, step in enumerate(report['next_steps'], 1):
+            write(f"{i}. {_md_escape(step)}\n")
+
+    def begin_portfolio(self, stream: IO[str]):
+        stream.write("# Platform Portfolio Report\n\n")
+
+    def write_entry(self, report: Dict, index: int, stream: IO[str]):
+        self.write_report(report, stream, heading='##')
+        stream.write("\n---\n\n")
+
+    def end_portfolio(self, summary: Dict, stream: IO[str]):
+        write = stream.write
+        write("## Portfolio Summary\n\n")
+        write(f"- Assessments: {summary['count']}\n")
+        write(f"- Average viability: {summary['average_percentage']:.1f}%\n")
+        write(f"- Range: {summary['min_percentage']:.1f}% - {summary['max_percentage']:.1f}%\n")
+        for viability, count in sorted(summary['viability_counts'].items()):
+            write(f"- {viability}: {count}\n")
+
+
+class HTMLRenderer(ReportRenderer):
+    """Static, self-contained HTML page"""
+
+    name = 'html'
+
+    def write_report(self, report: Dict, stream: IO[str]):
+        stream.write(_HTML_DOCUMENT_START(title="Platform Launch Assessment"))
+        self._write_section(report, stream, level=1)
+        stream.write(_HTML_DOCUMENT_END)
+
+    def _write_section(self, report: Dict, stream: IO[str], level: int):
+        write = stream.write
+        name = report.get('platform_name')
+        write(_HTML_HEADER(level=level, name=f": {escape(str(name))}" if name else '',
+                           generated=report['generated'].strftime('%Y-%m-%d %H:%M:%S'),
+                           total=report['total_score'], max=report['max_score'],
+                           percentage=report['percentage'], viability=escape(report['viability'])))
+        for score_dict in report['category_scores']:
+            write(_HTML_ROW(category=escape(score_dict['category']), score=score_dict['score'],
+                            max_score=score_dict['max_score'],
+                            percentage=_category_percentage(score_dict)))
+        write("</table>\n")
+
+        sub = level + 1
+        for score_dict in report['category_scores']:
+            self._write_list(score_dict['category'], score_dict['feedback'], stream, sub)
+        if report['strengths']:
+            self._write_list("Key Strengths", report['strengths'], stream, sub)
+        if report['risks']:
+            self._write_list("Critical Risks", report['risks'], stream, sub)
+        self._write_list("Strategic Recommendations", report['recommendations'], stream, sub, tag='ol')
+        self._write_list("Suggested Next Steps", report['next_steps'], stream, sub, tag='ol')
+        write("</section>\n")
+
+    def _write_list(self, title: str, items: List[str], stream: IO[str], level: int, tag: str = 'ul'):
+        write = stream.write
+        write(_HTML_SECTION(level=level, title=escape(title), tag=tag))
+        for item in items:
+            write(f"<li>{escape(item)}</li>\n")
+        write(f"</{tag}>\n")
+
+    def begin_portfolio(self, stream: IO[str]):
+        stream.write(_HTML_DOCUMENT_START(title="Platform Portfolio Report"))
+        stream.write("<h1>Platform Portfolio Report</h1>\n")
+
+    def write_entry(self, report: Dict, index: int, stream: IO[str]):
+        self._write_section(report, stream, level=2)
+
+    def end_portfolio(self, summary: Dict, stream: IO[str]):
+        write = stream.write
+        write("<section class=\"summary\">\n<h2>Portfolio Summary</h2>\n<ul>\n")
+        write(f"<li>Assessments: {summary['count']}</li>\n")
+        write(f"<li>Average viability: {summary['average_percentage']:.1f}%</li>\n")
+        write(f"<li>Range: {summary['min_percentage']:.1f}% - {summary['max_percentage']:.1f}%</li>\n")
+        for viability, count in sorted(summary['viability_counts'].items()):
+            write(f"<li>{escape(viability)}: {count}</li>\n")
+        write("</ul>\n</section>\n")
+        write(_HTML_DOCUMENT_END)
+
+
+RENDERERS = {
+    renderer.name: renderer
+    for renderer in (TextRenderer, JSONRenderer, NDJSONRenderer, MarkdownRenderer, HTMLRenderer)
+}
+
+
+def get_renderer(output_format: str) -> ReportRenderer:
+    """Return a renderer instance for the given format name"""
+    try:
+        return RENDERERS[output_format]()
+    except KeyError:
+        raise ValueError(f"Unknown output format: {output_format}") from None
+
+
+def write_portfolio(reports, renderer: ReportRenderer, stream: IO[str],
+                    summary: Optional[PortfolioSummary] = None) -> Dict:
+    """Render an iterable of evaluated assessments into one document.
+
+    Reports are consumed one at a time, so memory stays bounded however
+    many assessments the iterable yields.
+    """
+    summary = summary or PortfolioSummary()
+    renderer.begin_portfolio(stream)
+    for index, report in enumerate(reports, 1):
+        summary.add(report)
+        renderer.write_entry(report, index, stream)
+    totals = summary.as_dict()
+    renderer.end_portfolio(totals, stream)
+    return totals